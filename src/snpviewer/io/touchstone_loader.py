@@ -7,11 +7,16 @@ import importlib
 import os
 import re
 
+import numpy as np
+
 if TYPE_CHECKING:  # pragma: no cover
     import skrf
 
 _SUPPORTED_TOUCHSTONE_PATTERN = re.compile(r"\.s\d+p$", re.IGNORECASE)
 
+# Populated on first successful import so repeated loads skip the import machinery.
+_SKRF: Any = None
+
 
 class TouchstoneLoaderError(Exception):
     """Base error for user-displayable Touchstone loader failures."""
@@ -47,12 +52,18 @@ def _is_supported_touchstone(path: Path) -> bool:
 
 
 def _load_skrf() -> Any:
+    global _SKRF
+
+    if _SKRF is not None:
+        return _SKRF
+
     try:
-        return importlib.import_module("skrf")
+        _SKRF = importlib.import_module("skrf")
     except ModuleNotFoundError as exc:
         raise TouchstoneParseError(
             "scikit-rf is not installed, cannot parse Touchstone files."
         ) from exc
+    return _SKRF
 
 
 def load_network(path: str | Path) -> "skrf.Network":
@@ -108,25 +119,27 @@ def get_reference_impedance(network: "skrf.Network") -> Any:
     if isinstance(z0, (int, float, complex)):
         return z0
 
-    if hasattr(z0, "tolist"):
-        z0 = z0.tolist()
-
-    if isinstance(z0, list):
-        flat_values: list[Any] = []
-
-        def _flatten(values: list[Any]) -> None:
-            for item in values:
-                if isinstance(item, list):
-                    _flatten(item)
-                else:
-                    flat_values.append(item)
-
-        _flatten(z0)
-        if flat_values and all(value == flat_values[0] for value in flat_values):
-            return flat_values[0]
+    try:
+        arr = np.asarray(z0)
+    except ValueError:
+        # Ragged nested sequences cannot form an array; compare their flattened rows.
+        flat = np.concatenate([np.ravel(row) for row in z0])
+        if flat.size and bool((flat == flat[0]).all()):
+            return flat[0].item() if isinstance(flat[0], np.generic) else flat[0]
         return z0
-
-    return z0
+    if arr.size == 0:
+        return arr.tolist()
+
+    # skrf stores z0 as (n_freq, n_port); probing the corners first rejects most
+    # non-uniform arrays without scanning every element.
+    first = arr.flat[0]
+    if arr.ndim == 2:
+        probe_agrees = bool((arr[(0, 0, -1, -1), (0, -1, 0, -1)] == first).all())
+    else:
+        probe_agrees = bool(arr.flat[-1] == first)
+    if probe_agrees and bool((arr == first).all()):
+        return first.item() if isinstance(first, np.generic) else first
+    return arr.tolist()
 
 
 def extract_metadata(network: "skrf.Network") -> TouchstoneMetadata:
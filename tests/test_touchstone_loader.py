@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any, NamedTuple
+import copy
 import sys
 
+import numpy as np
 import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -13,6 +17,7 @@ from snpviewer.io import touchstone_loader as loader
 from snpviewer.io.touchstone_loader import (
     TouchstoneFileNotFoundError,
     TouchstoneFileReadError,
+    TouchstoneLoaderError,
     TouchstoneParseError,
     UnsupportedTouchstoneFormatError,
     extract_metadata,
@@ -24,71 +29,221 @@ from snpviewer.io.touchstone_loader import (
 )
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "touchstone"
+_VALID_2PORT = str(FIXTURE_DIR / "valid_2port.s2p")
+_MISSING = str(FIXTURE_DIR / "does_not_exist.s2p")
+_NOT_TOUCHSTONE = str(FIXTURE_DIR / "not_touchstone.txt")
+_INVALID_2PORT = str(FIXTURE_DIR / "invalid_2port.s2p")
+
+_PAYLOAD_CACHE: dict[str, bytes] = {}
+_INVALID_MARKER = b"not a valid"
+_HEADER_PROBE_SIZE = 256
+
+
+class _Freq(NamedTuple):
+    unit: str
+    f: tuple[float, ...]
+
+
+_SHARED_FREQ = _Freq(unit="GHz", f=(1e9, 2e9))
+_Z0_DEFAULT = np.full((2, 2), 50.0, dtype=np.float64)
+_Z0_DEFAULT.setflags(write=False)
 
 
 class FakeNetwork:
+    __slots__ = ("frequency", "nports", "z0")
+
     def __init__(self, path: str) -> None:
-        payload = Path(path).read_text(encoding="utf-8")
-        if "not a valid" in payload:
+        key = str(Path(path).resolve())
+        payload = _PAYLOAD_CACHE.get(key)
+        if payload is None:
+            with open(path, "rb") as handle:
+                payload = handle.read(_HEADER_PROBE_SIZE)
+            _PAYLOAD_CACHE[key] = payload
+        if payload.find(_INVALID_MARKER) != -1:
             raise ValueError("failed parsing")
 
         self.nports = 2
-        self.frequency = SimpleNamespace(unit="GHz", f=[1e9, 2e9])
-        self.z0 = [[50.0, 50.0], [50.0, 50.0]]
+        self.frequency = _SHARED_FREQ
+        self.z0: Any = _Z0_DEFAULT
 
 
-@pytest.fixture(autouse=True)
-def patch_skrf(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_skrf = SimpleNamespace(Network=FakeNetwork)
+_FAKE_SKRF = SimpleNamespace(Network=FakeNetwork)
 
-    def fake_import(name: str) -> object:
-        if name == "skrf":
-            return fake_skrf
-        raise ModuleNotFoundError(name)
 
-    monkeypatch.setattr(loader.importlib, "import_module", fake_import)
+@pytest.fixture(scope="module", autouse=True)
+def patch_skrf() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(loader, "_SKRF", _FAKE_SKRF)
+        yield
 
 
-def test_load_network_success() -> None:
-    network = load_network(FIXTURE_DIR / "valid_2port.s2p")
+@pytest.fixture(scope="module")
+def valid_network() -> FakeNetwork:
+    # Shared across the module: tests must copy.copy() it before rebinding attributes.
+    return load_network(_VALID_2PORT)
 
-    assert get_nports(network) == 2
-    assert get_frequency_unit(network).lower() == "ghz"
-    assert get_frequency_range(network) == pytest.approx((1.0e9, 2.0e9))
-    assert get_reference_impedance(network) == pytest.approx(50.0)
 
-    metadata = extract_metadata(network)
+def test_load_network_success(valid_network: FakeNetwork) -> None:
+    assert get_nports(valid_network) == 2
+    assert get_frequency_unit(valid_network).lower() == "ghz"
+    assert get_frequency_range(valid_network) == (1.0e9, 2.0e9)
+    assert get_reference_impedance(valid_network) == 50.0
+
+    metadata = extract_metadata(valid_network)
     assert metadata.nports == 2
     assert metadata.frequency_unit.lower() == "ghz"
-    assert metadata.frequency_range == pytest.approx((1.0e9, 2.0e9))
-    assert metadata.z0 == pytest.approx(50.0)
+    assert metadata.frequency_range == (1.0e9, 2.0e9)
+    assert metadata.z0 == 50.0
+
 
+def test_load_network_imports_skrf_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    imported: list[str] = []
 
-def test_load_network_missing_file_maps_exception() -> None:
-    with pytest.raises(TouchstoneFileNotFoundError):
-        load_network(FIXTURE_DIR / "does_not_exist.s2p")
+    def fake_import(name: str) -> object:
+        imported.append(name)
+        return _FAKE_SKRF
+
+    monkeypatch.setattr(loader, "_SKRF", None)
+    monkeypatch.setattr(loader.importlib, "import_module", fake_import)
 
+    load_network(_VALID_2PORT)
+    load_network(_VALID_2PORT)
 
-def test_load_network_unsupported_extension_maps_exception() -> None:
-    with pytest.raises(UnsupportedTouchstoneFormatError):
-        load_network(FIXTURE_DIR / "not_touchstone.txt")
+    assert imported == ["skrf"]
+    assert loader._SKRF is _FAKE_SKRF
 
 
-def test_load_network_path_not_file_maps_exception() -> None:
-    with pytest.raises(TouchstoneFileReadError):
-        load_network(FIXTURE_DIR)
+def test_load_network_missing_skrf_maps_exception(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_import(name: str) -> object:
+        raise ModuleNotFoundError(name)
 
+    monkeypatch.setattr(loader, "_SKRF", None)
+    monkeypatch.setattr(loader.importlib, "import_module", fake_import)
 
-def test_load_network_parse_error_maps_exception() -> None:
     with pytest.raises(TouchstoneParseError):
-        load_network(FIXTURE_DIR / "invalid_2port.s2p")
+        load_network(_VALID_2PORT)
+    assert loader._SKRF is None
+
+
+@pytest.mark.parametrize(
+    ("target", "expected"),
+    [
+        (_MISSING, TouchstoneFileNotFoundError),
+        (_NOT_TOUCHSTONE, UnsupportedTouchstoneFormatError),
+        (FIXTURE_DIR, TouchstoneFileReadError),
+        (_INVALID_2PORT, TouchstoneParseError),
+    ],
+    ids=["missing-file", "unsupported-extension", "path-not-file", "parse-error"],
+)
+def test_load_network_maps_exception(
+    target: str | Path, expected: type[TouchstoneLoaderError]
+) -> None:
+    with pytest.raises(expected):
+        load_network(target)
 
 
-def test_reference_impedance_returns_nested_values_for_nonuniform_z0() -> None:
-    network = load_network(FIXTURE_DIR / "valid_2port.s2p")
-    network.z0 = [[50.0, 75.0], [50.0, 75.0]]
+def test_reference_impedance_returns_nested_values_for_nonuniform_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = np.array([[50.0, 75.0], [50.0, 75.0]], dtype=np.float64)
 
     z0 = get_reference_impedance(network)
 
     assert isinstance(z0, list)
     assert z0 == [[50.0, 75.0], [50.0, 75.0]]
+
+
+def test_reference_impedance_scans_interior_when_corners_agree(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = np.array([[50.0, 50.0], [75.0, 75.0], [50.0, 50.0]], dtype=np.float64)
+
+    z0 = get_reference_impedance(network)
+
+    assert isinstance(z0, list)
+    assert z0 == [[50.0, 50.0], [75.0, 75.0], [50.0, 50.0]]
+
+
+def test_reference_impedance_handles_one_dimensional_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = np.array([50.0, 75.0, 50.0], dtype=np.float64)
+
+    assert get_reference_impedance(network) == [50.0, 75.0, 50.0]
+
+
+def test_reference_impedance_returns_python_complex_for_uniform_complex_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = np.full((3, 2), 50.0 + 1.0j, dtype=np.complex128)
+
+    z0 = get_reference_impedance(network)
+
+    assert type(z0) is complex
+    assert z0 == 50.0 + 1.0j
+
+
+def test_reference_impedance_returns_empty_list_for_empty_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = np.empty((0, 2), dtype=np.float64)
+
+    z0 = get_reference_impedance(network)
+
+    assert isinstance(z0, list)
+    assert z0 == []
+
+
+def test_reference_impedance_returns_empty_list_for_empty_tuple_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = ()
+
+    assert get_reference_impedance(network) == []
+
+
+def test_reference_impedance_collapses_uniform_tuple_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = ((50.0, 50.0), (50.0, 50.0))
+
+    assert get_reference_impedance(network) == 50.0
+
+
+def test_reference_impedance_passes_through_object_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = None
+
+    assert get_reference_impedance(network) is None
+
+
+def test_reference_impedance_collapses_uniform_ragged_z0(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = [[50.0, 50.0], [50.0]]
+
+    z0 = get_reference_impedance(network)
+
+    assert type(z0) is float
+    assert z0 == 50.0
+
+
+def test_reference_impedance_returns_nonuniform_ragged_z0_unchanged(
+    valid_network: FakeNetwork,
+) -> None:
+    network = copy.copy(valid_network)
+    network.z0 = [[50.0, 50.0], [75.0]]
+
+    assert get_reference_impedance(network) == [[50.0, 50.0], [75.0]]